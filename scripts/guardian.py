@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Static guard for the kernel's irreversible-truth laws.
+
+Two checks, both heuristic tripwires for review rather than proofs:
+
+- Ghost state (membrane law): scans kernel.ts for writes to
+  authoritative tables with no event/receipt/append activity nearby.
+- Migrations: applies every SQL migration to a scratch in-memory SQLite
+  database to prove the set still composes from an empty schema.
+
+Exits non-zero on findings.
+
+Usage: python3 scripts/guardian.py [kernel.ts path]
+"""
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import sys
+from bisect import bisect_left
+from pathlib import Path
+
+KERNEL_PATH = "src/kernel/kernel.ts"
+MIGRATIONS_DIR = "src/db/migrations"
+
+SUSPICIOUS_TABLES = ("budgets", "policies", "agents", "users", "agent_tokens")
+
+# A write is considered logged if one of these appears within the window.
+CONTEXT_KEYWORDS = ("event", "receipt", "append")
+CONTEXT_WINDOW = 300  # chars on each side of the write
+
+# One alternation, one pass. Covers both the drizzle call forms the kernel
+# uses (db.insert(budgets)...) and raw SQL in prepared statements. Matched
+# against the translate-lowered buffer, so no IGNORECASE: the one C-loop
+# fold up front is cheaper than per-character case folding in the engine,
+# and it also folds the camelCase identifiers.
+_TABLES_ALT = "|".join(
+    sorted({t.lower() for t in SUSPICIOUS_TABLES} | {t.replace("_", "").lower() for t in SUSPICIOUS_TABLES})
+)
+GHOST_RE = re.compile(
+    (
+        r"(?:\.\s*(?:insert|update|delete)\s*\(\s*|(?:insert\s+into|update|delete\s+from)\s+)"
+        r"(?P<table>" + _TABLES_ALT + r")\b"
+    ).encode("ascii")
+)
+CONTEXT_NEEDLES = tuple(kw.encode("ascii") for kw in CONTEXT_KEYWORDS)
+
+# ASCII case-fold table: one bytes.translate C loop folds the buffer, after
+# which the context keywords are plain literals needing no regex at all.
+_LOWER_TAB = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+def _find_all(buf: bytes, needle: bytes):
+    pos = buf.find(needle)
+    while pos != -1:
+        yield pos
+        pos = buf.find(needle, pos + 1)
+
+
+def scan_for_ghost_state(buf) -> list[tuple[int, str]]:
+    """Return (line_no, table) for each unlogged suspicious write.
+
+    Accepts any bytes-like buffer. The whole buffer is copied and
+    case-folded up front — one C-loop translate is cheaper than
+    engine-side IGNORECASE folding, at the cost of touching every byte.
+    """
+    # All context-keyword offsets, computed once; each match then needs a
+    # single bisect instead of slicing a window and probing three substrings.
+    # Three memchr-driven find loops over the case-folded buffer beat a
+    # case-folding regex alternation; an Aho-Corasick automaton would do it
+    # in one pass but is not worth a dependency for three short literals.
+    low = bytes(buf).translate(_LOWER_TAB)
+    ctx = sorted(pos for needle in CONTEXT_NEEDLES for pos in _find_all(low, needle))
+    findings = []
+    for m in GHOST_RE.finditer(low):
+        lo = bisect_left(ctx, m.start() - CONTEXT_WINDOW)
+        if lo < len(ctx) and ctx[lo] < m.end() + CONTEXT_WINDOW:
+            continue
+        # Folding only moves ASCII letters, so offsets and newlines in low
+        # line up exactly with the original buffer.
+        line_no = low.count(b"\n", 0, m.start()) + 1
+        findings.append((line_no, m.group("table").decode("ascii")))
+    return findings
+
+
+def find_sql_migrations() -> list[str]:
+    """Migration file paths in apply order (names sort lexicographically).
+
+    One os.scandir pass per candidate: the suffix check runs on
+    entry.name and is_file reuses the DirEntry's cached stat, where
+    glob.glob would pay fnmatch plus an extra stat per entry.
+    """
+    candidates = (Path(MIGRATIONS_DIR), Path(__file__).resolve().parent.parent / MIGRATIONS_DIR)
+    for candidate in candidates:
+        try:
+            with os.scandir(candidate) as entries:
+                return sorted(
+                    e.path for e in entries if e.name.endswith(".sql") and e.is_file(follow_symlinks=False)
+                )
+        except OSError:
+            continue
+    return []
+
+
+def open_check_db() -> sqlite3.Connection:
+    """Ephemeral in-memory database; durability pragmas are dead weight here."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    return conn
+
+
+def apply_migrations(conn: sqlite3.Connection, sql_files: list[str]) -> None:
+    """Apply all migrations in one executescript dispatch.
+
+    Scripts are concatenated and wrapped in a single transaction; a
+    per-file executescript would pay dispatch and commit overhead once
+    per migration for no benefit on a scratch database.
+    """
+    scripts = [Path(f).read_text(encoding="utf-8") for f in sql_files]
+    conn.executescript("BEGIN;\n" + ";\n".join(scripts) + ";\nCOMMIT;")
+
+
+# Prepared once at module scope; the check re-runs these in CI.
+_SEED_USER_SQL = "INSERT INTO users (user_id, created_at) VALUES (?, ?)"
+_SEED_AGENT_SQL = (
+    "INSERT INTO agents (agent_id, user_id, status, created_at, updated_at) VALUES (?, ?, 'active', ?, ?)"
+)
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events (event_id, agent_id, user_id, type, payload_json,"
+    " occurred_at, created_at, hash, prev_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_RECEIPT_SQL = (
+    "INSERT INTO receipts (receipt_id, agent_id, user_id, source, event_id, external_ref,"
+    " what_happened, why_changed, what_happens_next, occurred_at, created_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Mutations the append-only triggers must reject.
+_BLOCKED_MUTATIONS = (
+    ("events", "UPDATE events SET type = 'tampered' WHERE event_id = 'evt_guardian_1'"),
+    ("events", "DELETE FROM events WHERE event_id = 'evt_guardian_1'"),
+    ("receipts", "UPDATE receipts SET what_happened = 'tampered' WHERE receipt_id = 'rcp_guardian_1'"),
+    ("receipts", "DELETE FROM receipts WHERE receipt_id = 'rcp_guardian_1'"),
+)
+
+
+def seed_append_only_fixture(conn: sqlite3.Connection) -> None:
+    """Seed one actor and a short hash-chained event trail plus a receipt.
+
+    Everything runs inside one transaction (the connection context
+    manager commits on success) instead of autocommitting per statement,
+    and the chained events go through a single executemany.
+    """
+    now = 0
+    with conn:
+        conn.execute(_SEED_USER_SQL, ("u_guardian", now))
+        conn.execute(_SEED_AGENT_SQL, ("a_guardian", "u_guardian", now, now))
+        conn.executemany(
+            _INSERT_EVENT_SQL,
+            [
+                ("evt_guardian_1", "a_guardian", "u_guardian", "guardian.check", "{}", now, now, "h1", None),
+                ("evt_guardian_2", "a_guardian", "u_guardian", "guardian.check", "{}", now, now, "h2", "h1"),
+            ],
+        )
+        conn.execute(
+            _INSERT_RECEIPT_SQL,
+            ("rcp_guardian_1", "a_guardian", "u_guardian", "policy", "evt_guardian_1", None, "seeded", "seeded", "seeded", now, now),
+        )
+
+
+def require_immutable_table(conn: sqlite3.Connection, table: str) -> list[str]:
+    """Missing append-only protections for a table; empty when enforced.
+
+    Scans each trigger's SQL individually — lowercasing row by row and
+    stopping as soon as all three flags are satisfied — rather than
+    joining every trigger body into one blob to probe.
+    """
+    rows = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    )
+    has_update = has_delete = has_raise = False
+    for (sql,) in rows:
+        low = sql.lower()
+        has_update = has_update or "before update" in low
+        has_delete = has_delete or "before delete" in low
+        has_raise = has_raise or "raise" in low
+        if has_update and has_delete and has_raise:
+            break
+    missing = []
+    if not has_update:
+        missing.append(f"{table}: no BEFORE UPDATE trigger")
+    if not has_delete:
+        missing.append(f"{table}: no BEFORE DELETE trigger")
+    if not has_raise:
+        missing.append(f"{table}: no trigger RAISEs on mutation")
+    return missing
+
+
+def check_append_only(conn: sqlite3.Connection) -> list[str]:
+    """Names of tables whose append-only triggers failed to fire."""
+    problems = []
+    for table, sql in _BLOCKED_MUTATIONS:
+        try:
+            conn.execute(sql)
+        except sqlite3.DatabaseError:
+            continue
+        problems.append(f"{table} accepted a mutation the triggers should block: {sql}")
+    return problems
+
+
+def main(argv: list[str]) -> int:
+    kernel_path = Path(argv[1] if len(argv) > 1 else KERNEL_PATH)
+    try:
+        findings = scan_for_ghost_state(kernel_path.read_bytes())
+    except OSError as exc:
+        print(f"guardian: cannot read {kernel_path}: {exc}")
+        return 2
+    rc = 0
+    for line_no, table in findings:
+        print(f"{kernel_path}:{line_no}: write to '{table}' with no event/receipt in sight")
+    if findings:
+        print(f"\nguardian: {len(findings)} possible ghost-state write(s). Authoritative mutations must be logged.")
+        rc = 1
+    else:
+        print("guardian: no ghost-state writes found.")
+
+    sql_files = find_sql_migrations()
+    if not sql_files:
+        print("guardian: no SQL migrations found.")
+        return max(rc, 2)
+    conn = open_check_db()
+    try:
+        try:
+            apply_migrations(conn, sql_files)
+        except sqlite3.Error as exc:
+            print(f"guardian: migrations failed to apply from scratch: {exc}")
+            return 1
+        print(f"guardian: {len(sql_files)} migration(s) apply cleanly from an empty schema.")
+
+        seed_append_only_fixture(conn)
+        problems = require_immutable_table(conn, "events")
+        problems += require_immutable_table(conn, "receipts")
+        problems += check_append_only(conn)
+        for problem in problems:
+            print(f"guardian: {problem}")
+        if problems:
+            return 1
+        print("guardian: events/receipts reject updates and deletes.")
+    finally:
+        conn.close()
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Lint user-facing surfaces for crypto jargon that must not leak to humans.
+
+The kernel is provider-agnostic: wallet/chain/gas language belongs in the
+provider adapters, never in presentation copy, console UI, SDK docs, or
+examples. This script scans those surfaces and exits non-zero on any hit.
+
+Usage: python3 scripts/semantics_lint.py [root ...]
+"""
+from __future__ import annotations
+
+import functools
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:  # optional: linear-time engine, if google-re2 happens to be installed
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+ROOTS = ("src/presentation", "src/console", "packages/sdk", "examples")
+
+SKIP_DIRS = {"node_modules", ".git", "dist", "build", "coverage"}
+
+EXTS = {".ts", ".tsx", ".js", ".jsx", ".md", ".html", ".txt"}
+EXT_NO_DOT = frozenset(e[1:] for e in EXTS)
+
+CODE_EXTS = {".ts", ".tsx", ".js", ".jsx"}
+HTML_EXTS = {".html", ".md"}
+
+# Extension dispatch resolved once per file, not re-tested per branch.
+# Keyed by bare suffix so the lookup needs no per-file string building.
+EXT_MODES = {**{e[1:]: "code" for e in CODE_EXTS}, **{e[1:]: "html" for e in HTML_EXTS}}
+
+BANNED_TERMS = ("wallet", "gas", "chain", "private key", "seed phrase")
+
+
+@functools.lru_cache(maxsize=None)
+def term_pattern(term: str) -> re.Pattern[str]:
+    """Whole-word pattern for a banned term; spaces match any whitespace run.
+
+    Cached so callers can treat it as free — a future per-file dispatch
+    will not quietly recompile per call.
+    """
+    words = term.split()
+    return re.compile(r"\b" + r"\s+".join(re.escape(w) for w in words) + r"\b", re.IGNORECASE)
+
+
+def _combined_pattern(terms: tuple[str, ...]) -> re.Pattern[bytes]:
+    """One alternation over all terms so a buffer costs a single search.
+
+    Compiled as a bytes pattern without re.IGNORECASE: files are read as
+    bytes and lowered once with bytes.lower() for the literal prefilter,
+    so the same lowered buffer feeds the regex, the engine skips
+    per-character case folding, and nothing is decoded until a hit has
+    to be reported. bytes.lower() folds ASCII only and is always
+    length-preserving, so offsets stay valid against the raw bytes.
+    """
+    alts = "|".join(r"\s+".join(re.escape(w) for w in t.split()) for t in terms)
+    pattern = (r"\b(?P<t>" + alts + r")\b").encode("ascii")
+    if _re2 is not None:
+        # RE2 walks a DFA in guaranteed linear time, which caps the worst
+        # case on adversarial buffers; the backtracking engine is only the
+        # fallback. Both expose the same finditer/group API.
+        try:
+            return _re2.compile(pattern)
+        except _re2.error:
+            pass
+    return re.compile(pattern)
+
+
+BANNED_RE = _combined_pattern(BANNED_TERMS)
+
+# Cheap substring prefilter: almost every line contains none of these, and
+# str.__contains__ is far cheaper than entering the regex engine. Multi-word
+# terms are represented by their first word so odd whitespace between words
+# (which the regex tolerates) cannot slip past the filter.
+LITERALS = tuple(t.split()[0].lower().encode("ascii") for t in BANNED_TERMS)
+
+
+def iter_files(root: str):
+    """Yield paths (str) of lintable files under root, depth-first.
+
+    Uses os.scandir directly so directory-vs-file checks reuse the stat
+    already cached on each DirEntry, and filters extensions on entry.name
+    without building a Path per candidate.
+    """
+    if os.path.isfile(root):
+        if root.rpartition(".")[2].lower() in EXT_NO_DOT:
+            yield root
+        return
+    yield from _scan(root)
+
+
+def _scan(path: str):
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from _scan(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.rpartition(".")[2].lower() in EXT_NO_DOT:
+                    yield entry.path
+
+
+HTML_TAG_RE = re.compile(rb"<[^>]+>")
+_NON_NEWLINE_RE = re.compile(rb"[^\n]")
+
+
+def strip_html_tags(data: bytes) -> bytes:
+    """Blank out markup without disturbing offsets or line numbers."""
+    return HTML_TAG_RE.sub(lambda m: _NON_NEWLINE_RE.sub(b" ", m.group()), data)
+
+
+# Unrolled-loop form: a run of plain characters, then (escape + run)*. No
+# per-character alternation to backtrack over and no capturing groups.
+STRING_LITERAL_RE = re.compile(
+    rb'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+    rb"|'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+    rb"|`[^`\\]*(?:\\[\s\S][^`\\]*)*`"
+)
+
+
+def extract_string_literals(data: bytes) -> list[tuple[int, int]]:
+    """Spans (start, end) of quoted string contents in a buffer of code.
+
+    Only string literals are linted in code files; identifiers like
+    `txHash` or provider imports are the adapters' business. Template
+    literals may span lines; quoted strings may not. Spans exclude the
+    quote characters, so they come straight off the match bounds without
+    allocating a group tuple.
+    """
+    spans = []
+    for m in STRING_LITERAL_RE.finditer(data):
+        start = m.start() + 1
+        end = m.end() - 1
+        if start < end:
+            spans.append((start, end))
+    return spans
+
+
+def scan_text(path: str, data: bytes, mode: str, hits: list) -> None:
+    """Run the banned-term scan over one file's raw bytes."""
+    low = data.lower()
+    if not any(t in low for t in LITERALS):
+        return
+    if mode == "html":
+        low = strip_html_tags(low)
+    matches = list(BANNED_RE.finditer(low))
+    if not matches:
+        return
+    if mode == "code":
+        # Sorted-merge: both match starts and literal spans are in text order.
+        spans = extract_string_literals(low)
+        kept = []
+        i = 0
+        for m in matches:
+            while i < len(spans) and spans[i][1] < m.end():
+                i += 1
+            if i < len(spans) and spans[i][0] <= m.start():
+                kept.append(m)
+        matches = kept
+    if not matches:
+        return
+    # Matches come back in buffer order, so line numbers accumulate with a
+    # C-level newline count per gap — no offset list proportional to the file.
+    line_no = 1
+    prev = 0
+    for m in matches:
+        line_no += low.count(b"\n", prev, m.start())
+        prev = m.start()
+        start = low.rfind(b"\n", 0, m.start()) + 1
+        end = low.find(b"\n", m.end())
+        if end == -1:
+            end = len(data)
+        term = m.group("t").decode("ascii")
+        line = data[start:end].decode("utf-8", errors="replace").strip()
+        hits.append((path, line_no, term, line))
+
+
+def scan_file(path: str) -> list[tuple[str, int, str, str]]:
+    """Scan one file; safe to run in a worker process."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return []
+    mode = EXT_MODES.get(path.rpartition(".")[2].lower(), "plain")
+    hits: list[tuple[str, int, str, str]] = []
+    scan_text(path, data, mode, hits)
+    return hits
+
+
+# Below this many files the fork/pickle overhead outweighs the scan itself.
+PARALLEL_THRESHOLD = 64
+
+# Print at most this many hits; the rest only feed the overflow counter.
+HIT_CAP = 200
+
+
+def iter_hits(paths: list[str]):
+    """Stream hit tuples file by file; nothing is held beyond one batch."""
+    if len(paths) < PARALLEL_THRESHOLD:
+        for path in paths:
+            yield from scan_file(path)
+    else:
+        # Embarrassingly parallel across files; compiled patterns live at
+        # module scope, so each worker pays compilation once.
+        with ProcessPoolExecutor() as ex:
+            for batch in ex.map(scan_file, paths, chunksize=64):
+                yield from batch
+
+
+def main(argv: list[str]) -> int:
+    roots = argv[1:] or [r for r in ROOTS if os.path.exists(r)]
+    paths = [path for root in roots for path in iter_files(root)]
+    shown = 0
+    extra = 0
+    for path, line_no, term, line in iter_hits(paths):
+        if shown < HIT_CAP:
+            print(f"{path}:{line_no}: banned term '{term}': {line}")
+            shown += 1
+        else:
+            extra += 1
+    if extra:
+        print(f"... {extra} more hit(s) not shown")
+    total = shown + extra
+    if total:
+        print(f"\nsemantics_lint: {total} hit(s). Keep crypto jargon out of user-facing surfaces.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))